@@ -1,101 +1,33 @@
 import streamlit as st
 import calendar
-from datetime import datetime, date
+from datetime import datetime, date, timedelta
+from functools import lru_cache
 import json
-from collections import defaultdict
+import time
 import requests
+import gspread
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 # Page config
 st.set_page_config(page_title="Habit Tracker", page_icon="📅", layout="wide")
 
-# Google Sheets configuration
-SHEET_ID = "1jiMRMTmGRgk_i4vLLDdIUR8y4f95g1aVmvMgy0yzpMw"
-SHEET_NAME = "Sheet1"
-
-def get_sheet_url():
-    return f"https://docs.google.com/spreadsheets/d/{SHEET_ID}/gviz/tq?tqx=out:csv&sheet={SHEET_NAME}"
-
-def get_sheet_edit_url():
-    return f"https://docs.google.com/spreadsheets/d/{SHEET_ID}/edit"
-
-# Load data from Google Sheets
-def load_data():
-    try:
-        # Try to load from Google Sheets
-        response = requests.get(get_sheet_url())
-        if response.status_code == 200:
-            lines = response.text.strip().split('\n')
-            if len(lines) > 1:  # Check if there's data beyond header
-                # Get the data from first row (removing quotes)
-                data_str = lines[1].strip('"')
-                if data_str:
-                    return json.loads(data_str)
-    except Exception as e:
-        st.warning(f"Could not load from Google Sheets: {e}")
-    
-    return get_default_data()
-
-# Save data to Google Sheets (via manual update)
-def save_data(data):
-    # Store in session state
-    st.session_state.habits = data
-    
-    # Generate the JSON string for manual copying
-    st.session_state.last_save_json = json.dumps(data, indent=2)
-
-# Default data structure
-def get_default_data():
-    return {
-        'Tennis': {'color': '#FF6B6B', 'count': {}},
-        'DSA Solving': {'color': '#4ECDC4', 'count': {}},
-        'Finance Learning': {'color': '#FFE66D', 'count': {}},
-        'notes': {}
-    }
-
-# Calculate streak for a habit
-def calculate_streak(habit_data, end_date):
-    dates = sorted([datetime.strptime(d, "%Y-%m-%d").date() for d in habit_data['count'].keys()], reverse=True)
-    if not dates:
-        return 0
-    
-    streak = 0
-    current = end_date
-    
-    for d in dates:
-        if d == current:
-            streak += 1
-            current = date(current.year, current.month, current.day - 1) if current.day > 1 else date(current.year, current.month - 1 if current.month > 1 else 12, calendar.monthrange(current.year, current.month - 1 if current.month > 1 else 12)[1])
-        elif d < current:
-            break
-    
-    return streak
-
-# Initialize session state
-if 'habits' not in st.session_state:
-    st.session_state.habits = load_data()
-    # Ensure notes key exists for backward compatibility
-    if 'notes' not in st.session_state.habits:
-        st.session_state.habits['notes'] = {}
-
-if 'current_month' not in st.session_state:
-    st.session_state.current_month = datetime.now().month
-
-if 'current_year' not in st.session_state:
-    st.session_state.current_year = datetime.now().year
-
-if 'view_mode' not in st.session_state:
-    st.session_state.view_mode = 'calendar'
-
-if 'last_save_json' not in st.session_state:
-    st.session_state.last_save_json = ""
-
 # Custom CSS
-st.markdown("""
+CSS = """
 <style>
     .stApp {
         background-color: #0a0a0a;
     }
     
+    .cal-grid {
+        display: grid;
+        grid-template-columns: repeat(7, 1fr);
+        gap: 6px;
+    }
+    
     .day-cell {
         border: 1px solid #333;
         padding: 4px 8px 10px 8px;
@@ -133,6 +65,35 @@ st.markdown("""
         display: inline-block;
     }
     
+    .heat-cell {
+        width: 100%;
+        height: 40px;
+        border-radius: 3px;
+        display: flex;
+        align-items: center;
+        justify-content: center;
+        color: white;
+        font-size: 12px;
+        border: 1px solid #333;
+        font-weight: bold;
+    }
+    
+    .h0 { opacity: 0.1; }
+    .h1 { opacity: 0.25; }
+    .h2 { opacity: 0.4; }
+    .h3 { opacity: 0.6; }
+    .h4 { opacity: 0.8; }
+    .h5 { opacity: 1; }
+    
+    .stat-row {
+        display: flex;
+        gap: 16px;
+    }
+    
+    .stat-row .stat-card {
+        flex: 1;
+    }
+    
     .stat-card {
         padding: 20px;
         border-radius: 10px;
@@ -203,7 +164,307 @@ st.markdown("""
         font-size: 12px;
     }
 </style>
-""", unsafe_allow_html=True)
+"""
+
+# HTML templates for the summary and dashboard blocks
+_STAT_TMPL = (
+    '<div class="stat-card" style="border-color: {color};">'
+    '<div style="font-size: 28px; margin-bottom: 5px;">{total}</div>'
+    '<div style="font-size: 16px; margin-bottom: 8px;">{name}</div>'
+    '<div style="font-size: 14px; color: #888;">🔥 {streak} day streak</div>'
+    '</div>'
+)
+
+_DIST_TMPL = (
+    "<div style='display: flex; align-items: center; gap: 10px; margin-bottom: 10px;'>"
+    "<div style='min-width: 150px; color: white;'>{name}</div>"
+    "<div style='flex-grow: 1; height: 30px; background: {color}; "
+    "border-radius: 5px; display: flex; align-items: center; "
+    "justify-content: center; color: white; font-weight: bold;'>"
+    "{count} ({percentage:.1f}%)"
+    "</div></div>"
+)
+
+_TOTAL_TMPL = (
+    "<div style='padding: 10px; margin: 5px 0; background: #1a1a1a; "
+    "border-left: 12px solid {color}; border-radius: 5px;'>"
+    "<div style='color: white; font-weight: bold;'>{name}</div>"
+    "<div style='color: {color}; font-size: 24px;'>{count}</div>"
+    "</div>"
+)
+
+# Google Sheets configuration
+SHEET_ID = "1jiMRMTmGRgk_i4vLLDdIUR8y4f95g1aVmvMgy0yzpMw"
+SHEET_NAME = "Sheet1"
+
+# JSON helpers; use orjson when it is installed, stdlib json otherwise
+def to_json(data, indent=False):
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 if indent else 0).decode()
+    return json.dumps(data, indent=2 if indent else None)
+
+def from_json(text):
+    if orjson is not None:
+        return orjson.loads(text)
+    return json.loads(text)
+
+def get_sheet_url():
+    return f"https://docs.google.com/spreadsheets/d/{SHEET_ID}/gviz/tq?tqx=out:csv&sheet={SHEET_NAME}"
+
+def get_sheet_edit_url():
+    return f"https://docs.google.com/spreadsheets/d/{SHEET_ID}/edit"
+
+# Fetch the raw sheet CSV (cached for a minute so reruns don't hit the
+# network; cleared by Force Refresh and after writes)
+@st.cache_data(ttl=60, show_spinner=False)
+def _fetch_sheet_csv(url):
+    response = requests.get(url, timeout=5)
+    response.raise_for_status()
+    return response.text
+
+# Seconds between writes to the sheet; edits inside the window are batched
+SAVE_DEBOUNCE_SECONDS = 1.0
+
+# Seconds to wait before reconnecting after the Sheets API failed
+SHEETS_RETRY_SECONDS = 60
+
+# Longest wait between automatic retries of a failed write; the wait
+# doubles from SAVE_DEBOUNCE_SECONDS after each consecutive failure
+SAVE_RETRY_MAX_SECONDS = 300
+
+# Spreadsheet handle for the Sheets API, shared across reruns and sessions
+@st.cache_resource(show_spinner=False)
+def _open_sheet():
+    credentials = dict(st.secrets["gcp_service_account"])
+    return gspread.service_account_from_dict(credentials).open_by_key(SHEET_ID)
+
+# Returns None when no service account is configured in st.secrets, or
+# when connecting failed (retried after SHEETS_RETRY_SECONDS)
+def _sheets_client():
+    try:
+        st.secrets["gcp_service_account"]
+    except Exception:
+        return None
+    if time.monotonic() < st.session_state.get('_sheets_retry_at', 0.0):
+        return None
+    try:
+        return _open_sheet()
+    except Exception as e:
+        st.session_state._sheets_retry_at = time.monotonic() + SHEETS_RETRY_SECONDS
+        st.warning(f"Could not connect to Google Sheets: {e}")
+        return None
+
+# Fetch the raw JSON string from a single cell through the Sheets API,
+# skipping the CSV export and its quoting (same cache policy as the CSV)
+@st.cache_data(ttl=60, show_spinner=False)
+def _fetch_sheet_cell(range_name):
+    response = _sheets_client().values_get(range_name, params={'valueRenderOption': 'UNFORMATTED_VALUE'})
+    values = response.get('values')
+    return values[0][0] if values and values[0] else ""
+
+# Drop cached sheet reads so the next load hits Google Sheets
+def clear_sheet_cache():
+    _fetch_sheet_csv.clear()
+    _fetch_sheet_cell.clear()
+
+# Load data from Google Sheets and build its derived lookups. Returns None
+# when the sheet could not be read or holds malformed data, so callers
+# never mistake a failed load for an empty sheet.
+def load_data():
+    try:
+        data = None
+        # Read the cell directly when API credentials are configured
+        if _sheets_client() is not None:
+            data_str = _fetch_sheet_cell(f"{SHEET_NAME}!A2")
+            if data_str:
+                data = from_json(data_str)
+        else:
+            # Otherwise fall back to the public CSV export
+            csv_text = _fetch_sheet_csv(get_sheet_url())
+            if csv_text:
+                lines = csv_text.strip().split('\n')
+                if len(lines) > 1:  # Check if there's data beyond header
+                    # Get the data from first row (removing quotes)
+                    data_str = lines[1].strip('"')
+                    if data_str:
+                        data = from_json(data_str)
+        if data is None:
+            data = get_default_data()
+        refresh_derived(data)
+        return data
+    except Exception as e:
+        st.warning(f"Could not load from Google Sheets: {e}")
+        return None
+
+# Write the whole habits dict to cell A2 in a single request.
+# Returns True when the sheet was updated. Unless forced, nothing is
+# written while the sheet has not been loaded this session, so a failed
+# load cannot overwrite the sheet with default data.
+def write_sheet(data, force=False):
+    if not force and not st.session_state.get('_loaded_from_sheet'):
+        return False
+    client = _sheets_client()
+    if client is None:
+        return False
+    try:
+        client.values_update(
+            f"{SHEET_NAME}!A2",
+            params={'valueInputOption': 'RAW'},
+            body={'values': [[to_json(data)]]}
+        )
+    except Exception as e:
+        # Back off so quota errors or oversized payloads are not retried every second
+        failures = st.session_state.get('_write_failures', 0) + 1
+        st.session_state._write_failures = failures
+        delay = min(SAVE_DEBOUNCE_SECONDS * 2 ** failures, SAVE_RETRY_MAX_SECONDS)
+        st.session_state._write_retry_at = time.monotonic() + delay
+        st.warning(f"Could not save to Google Sheets: {e}")
+        return False
+    st.session_state._write_failures = 0
+    st.session_state._write_retry_at = 0.0
+    clear_sheet_cache()
+    st.session_state._dirty = False
+    st.session_state._last_write_ts = time.monotonic()
+    st.session_state._loaded_from_sheet = True
+    return True
+
+# Write pending edits unless the sheet was written within the debounce
+# window or a failed write is still backing off
+def flush_sheet():
+    now = time.monotonic()
+    if (
+        st.session_state.get('_dirty')
+        and st.session_state.get('_loaded_from_sheet')
+        and now - st.session_state.get('_last_write_ts', 0.0) > SAVE_DEBOUNCE_SECONDS
+        and now >= st.session_state.get('_write_retry_at', 0.0)
+    ):
+        write_sheet(st.session_state.habits)
+
+# Picks up edits deferred by flush_sheet once the window has passed,
+# without waiting for the next full run of the app
+@st.fragment(run_every=SAVE_DEBOUNCE_SECONDS)
+def sheet_flusher():
+    flush_sheet()
+
+# Save data to Google Sheets (debounced, or via manual update)
+def save_data(data):
+    # Rebuild derived values first so the next render reflects the change;
+    # malformed data raises here, before it is stored or marked for writing
+    refresh_derived(data)
+    
+    # Store in session state
+    st.session_state.habits = data
+    
+    # Mark the sheet as stale; flush_sheet writes it
+    st.session_state._dirty = True
+    
+    # Generate the JSON string for manual copying
+    st.session_state.last_save_json = to_json(data, indent=True)
+
+# Calendar layout helpers; pure functions of (year, month)
+@lru_cache(maxsize=256)
+def _monthcalendar(year, month):
+    return calendar.monthcalendar(year, month)
+
+@lru_cache(maxsize=256)
+def _monthrange(year, month):
+    return calendar.monthrange(year, month)
+
+# Default data structure
+def get_default_data():
+    return {
+        'Tennis': {'color': '#FF6B6B', 'count': {}},
+        'DSA Solving': {'color': '#4ECDC4', 'count': {}},
+        'Finance Learning': {'color': '#FFE66D', 'count': {}},
+        'notes': {}
+    }
+
+# Calculate streak for a habit from its set of parsed dates
+def calculate_streak(dates, end_date):
+    streak = 0
+    while end_date - timedelta(days=streak) in dates:
+        streak += 1
+    return streak
+
+# Group each habit's counts by month: {habit: {"YYYY-MM": {day: count}}}
+def _reindex(habits):
+    by_month = {}
+    for habit_name, habit_data in habits.items():
+        if habit_name == 'notes':
+            continue
+        months = {}
+        for date_key, count in habit_data['count'].items():
+            months.setdefault(date_key[:7], {})[int(date_key[8:10])] = count
+        by_month[habit_name] = months
+    return by_month
+
+# Monthly totals per habit, read from the per-month index
+def compute_monthly_totals(year, month):
+    ym = f"{year}-{month:02d}"
+    return {
+        habit_name: sum(months.get(ym, {}).values())
+        for habit_name, months in st.session_state.habits_by_month.items()
+    }
+
+# Parse each habit's date keys once: {habit: {date, ...}}
+def _parse_dates(habits):
+    return {
+        habit_name: {date.fromisoformat(k) for k in habit_data['count']}
+        for habit_name, habit_data in habits.items()
+        if habit_name != 'notes'
+    }
+
+# Rebuild the lookups derived from the habits; only needed when data changes.
+# Raises on malformed data before anything in session state is replaced.
+def refresh_derived(data):
+    for habit_name, habit_data in data.items():
+        if habit_name != 'notes' and not (
+            isinstance(habit_data, dict)
+            and isinstance(habit_data.get('color'), str)
+            and isinstance(habit_data.get('count'), dict)
+        ):
+            raise ValueError(f"Malformed habit: {habit_name}")
+    habits_parsed = _parse_dates(data)  # validates the ISO date keys
+    habits_by_month = _reindex(data)
+    st.session_state.habits_parsed = habits_parsed
+    st.session_state.habits_by_month = habits_by_month
+
+# Current streak per habit, read from the parsed date sets
+def compute_streaks(today):
+    return {
+        habit_name: calculate_streak(dates, today)
+        for habit_name, dates in st.session_state.habits_parsed.items()
+    }
+
+# Initialize session state
+if 'habits' not in st.session_state:
+    loaded_data = load_data()
+    st.session_state._loaded_from_sheet = loaded_data is not None
+    st.session_state.habits = loaded_data if loaded_data is not None else get_default_data()
+    # Ensure notes key exists for backward compatibility
+    if 'notes' not in st.session_state.habits:
+        st.session_state.habits['notes'] = {}
+
+if 'habits_parsed' not in st.session_state:
+    refresh_derived(st.session_state.habits)
+
+if 'current_month' not in st.session_state:
+    st.session_state.current_month = datetime.now().month
+
+if 'current_year' not in st.session_state:
+    st.session_state.current_year = datetime.now().year
+
+if 'view_mode' not in st.session_state:
+    st.session_state.view_mode = 'calendar'
+
+if 'last_save_json' not in st.session_state:
+    st.session_state.last_save_json = ""
+
+# Habit names (everything except the notes entry), computed once per run
+habit_names = [k for k in st.session_state.habits if k != 'notes']
+
+# Inject the stylesheet; Streamlit drops elements a rerun does not re-emit
+st.markdown(CSS, unsafe_allow_html=True)
 
 # Title
 st.title("📅 Habit Tracker")
@@ -240,37 +501,39 @@ with st.sidebar:
     # Add habit section
     st.subheader("Add Habit Activity")
     current_date = datetime.now()
-    selected_day = st.number_input("Day", min_value=1, max_value=31, value=current_date.day if st.session_state.current_month == current_date.month else 1)
-    selected_habit = st.selectbox("Habit", [k for k in st.session_state.habits.keys() if k != 'notes'])
-    
-    if st.button("➕ Add Activity", use_container_width=True):
-        date_key = f"{st.session_state.current_year}-{st.session_state.current_month:02d}-{selected_day:02d}"
-        if date_key not in st.session_state.habits[selected_habit]['count']:
-            st.session_state.habits[selected_habit]['count'][date_key] = 0
-        st.session_state.habits[selected_habit]['count'][date_key] += 1
-        save_data(st.session_state.habits)
-        st.success(f"Added {selected_habit}!")
-        st.rerun()
+    with st.form("add_activity", border=False):
+        selected_day = st.number_input("Day", min_value=1, max_value=31, value=current_date.day if st.session_state.current_month == current_date.month else 1)
+        selected_habit = st.selectbox("Habit", habit_names)
+        
+        if st.form_submit_button("➕ Add Activity", use_container_width=True):
+            date_key = f"{st.session_state.current_year}-{st.session_state.current_month:02d}-{selected_day:02d}"
+            if date_key not in st.session_state.habits[selected_habit]['count']:
+                st.session_state.habits[selected_habit]['count'][date_key] = 0
+            st.session_state.habits[selected_habit]['count'][date_key] += 1
+            save_data(st.session_state.habits)
+            st.success(f"Added {selected_habit}!")
+            st.rerun()
     
     st.divider()
     
     # Remove habit section
     st.subheader("Remove Activity")
-    remove_day = st.number_input("Day to remove from", min_value=1, max_value=31, value=current_date.day if st.session_state.current_month == current_date.month else 1, key="remove_day")
-    remove_habit = st.selectbox("Habit to remove", [k for k in st.session_state.habits.keys() if k != 'notes'], key="remove_habit")
-    
-    if st.button("➖ Remove One", use_container_width=True):
-        date_key = f"{st.session_state.current_year}-{st.session_state.current_month:02d}-{remove_day:02d}"
-        if date_key in st.session_state.habits[remove_habit]['count']:
-            if st.session_state.habits[remove_habit]['count'][date_key] > 1:
-                st.session_state.habits[remove_habit]['count'][date_key] -= 1
+    with st.form("remove_activity", border=False):
+        remove_day = st.number_input("Day to remove from", min_value=1, max_value=31, value=current_date.day if st.session_state.current_month == current_date.month else 1, key="remove_day")
+        remove_habit = st.selectbox("Habit to remove", habit_names, key="remove_habit")
+        
+        if st.form_submit_button("➖ Remove One", use_container_width=True):
+            date_key = f"{st.session_state.current_year}-{st.session_state.current_month:02d}-{remove_day:02d}"
+            if date_key in st.session_state.habits[remove_habit]['count']:
+                if st.session_state.habits[remove_habit]['count'][date_key] > 1:
+                    st.session_state.habits[remove_habit]['count'][date_key] -= 1
+                else:
+                    del st.session_state.habits[remove_habit]['count'][date_key]
+                save_data(st.session_state.habits)
+                st.success(f"Removed one {remove_habit}!")
+                st.rerun()
             else:
-                del st.session_state.habits[remove_habit]['count'][date_key]
-            save_data(st.session_state.habits)
-            st.success(f"Removed one {remove_habit}!")
-            st.rerun()
-        else:
-            st.warning("No activity on that day!")
+                st.warning("No activity on that day!")
     
     st.divider()
     
@@ -278,32 +541,33 @@ with st.sidebar:
     st.subheader("Manage Habits")
     
     with st.expander("➕ Add New Habit"):
-        new_habit_name = st.text_input("Habit Name")
-        new_habit_color = st.color_picker("Color", "#9B59B6")
-        if st.button("Create Habit", use_container_width=True):
-            if new_habit_name and new_habit_name not in st.session_state.habits and new_habit_name != 'notes':
-                st.session_state.habits[new_habit_name] = {'color': new_habit_color, 'count': {}}
-                save_data(st.session_state.habits)
-                st.success(f"Added {new_habit_name}!")
-                st.rerun()
-            elif new_habit_name in st.session_state.habits:
-                st.error("Habit already exists!")
-            else:
-                st.error("Please enter a habit name!")
+        with st.form("new_habit", border=False):
+            new_habit_name = st.text_input("Habit Name")
+            new_habit_color = st.color_picker("Color", "#9B59B6")
+            if st.form_submit_button("Create Habit", use_container_width=True):
+                if new_habit_name and new_habit_name not in st.session_state.habits and new_habit_name != 'notes':
+                    st.session_state.habits[new_habit_name] = {'color': new_habit_color, 'count': {}}
+                    save_data(st.session_state.habits)
+                    st.success(f"Added {new_habit_name}!")
+                    st.rerun()
+                elif new_habit_name in st.session_state.habits:
+                    st.error("Habit already exists!")
+                else:
+                    st.error("Please enter a habit name!")
     
     with st.expander("🎨 Edit Habit Colors"):
-        for habit_name in [k for k in st.session_state.habits.keys() if k != 'notes']:
-            col1, col2 = st.columns([3, 1])
-            with col1:
-                new_color = st.color_picker(f"{habit_name}", st.session_state.habits[habit_name]['color'], key=f"color_{habit_name}")
-            with col2:
-                if st.button("💾", key=f"save_{habit_name}"):
+        with st.form("edit_colors", border=False):
+            new_colors = {}
+            for habit_name in habit_names:
+                new_colors[habit_name] = st.color_picker(f"{habit_name}", st.session_state.habits[habit_name]['color'], key=f"color_{habit_name}")
+            if st.form_submit_button("💾 Save Colors", use_container_width=True):
+                for habit_name, new_color in new_colors.items():
                     st.session_state.habits[habit_name]['color'] = new_color
-                    save_data(st.session_state.habits)
-                    st.rerun()
+                save_data(st.session_state.habits)
+                st.rerun()
     
     with st.expander("🗑️ Delete Habit"):
-        delete_habit = st.selectbox("Select habit to delete", [k for k in st.session_state.habits.keys() if k != 'notes'], key="delete_select")
+        delete_habit = st.selectbox("Select habit to delete", habit_names, key="delete_select")
         if st.button("Delete", use_container_width=True, type="primary"):
             del st.session_state.habits[delete_habit]
             save_data(st.session_state.habits)
@@ -313,9 +577,8 @@ with st.sidebar:
     st.divider()
     
     if st.button("🗑️ Clear All Data", use_container_width=True):
-        for habit in st.session_state.habits:
-            if habit != 'notes':
-                st.session_state.habits[habit]['count'] = {}
+        for habit in habit_names:
+            st.session_state.habits[habit]['count'] = {}
         save_data(st.session_state.habits)
         st.success("All data cleared!")
         st.rerun()
@@ -330,74 +593,91 @@ with st.sidebar:
         st.markdown("**Current Sheet:**")
         st.markdown(f"[Open Google Sheet]({get_sheet_edit_url()})")
         
-        if st.button("🔄 Load from Sheet", use_container_width=True):
+        if st.button("🔄 Force Refresh from Sheet", use_container_width=True):
+            clear_sheet_cache()
             loaded_data = load_data()
-            st.session_state.habits = loaded_data
-            st.success("Loaded from Google Sheets!")
-            st.rerun()
+            if loaded_data is None:
+                # Keep the current data, but stop writing it over the sheet
+                st.session_state._loaded_from_sheet = False
+            else:
+                st.session_state._loaded_from_sheet = True
+                st.session_state.habits = loaded_data
+                st.success("Loaded from Google Sheets!")
+                st.rerun()
         
-        if st.button("💾 Prepare to Save", use_container_width=True):
+        if _sheets_client() is not None:
+            if not st.session_state._loaded_from_sheet:
+                st.warning("The sheet could not be loaded, so edits are not saved to it automatically.")
+            if st.button("💾 Save to Sheet Now", use_container_width=True):
+                if st.session_state._loaded_from_sheet:
+                    if write_sheet(st.session_state.habits):
+                        st.success("Saved to Google Sheets!")
+                else:
+                    st.session_state._confirm_overwrite = True
+            if st.session_state.get('_confirm_overwrite'):
+                st.warning("Saving replaces everything in the sheet with the data shown here. Overwrite it?")
+                col1, col2 = st.columns(2)
+                if col1.button("Overwrite", use_container_width=True):
+                    st.session_state._confirm_overwrite = False
+                    if write_sheet(st.session_state.habits, force=True):
+                        st.success("Saved to Google Sheets!")
+                if col2.button("Cancel", use_container_width=True):
+                    st.session_state._confirm_overwrite = False
+                    st.rerun()
+        elif st.button("💾 Prepare to Save", use_container_width=True):
             save_data(st.session_state.habits)
             st.success("Data ready to save!")
         
-        if st.session_state.last_save_json:
+        if _sheets_client() is None and st.session_state.last_save_json:
             st.markdown("**Copy this to cell A2 in your sheet:**")
             st.code(st.session_state.last_save_json, language="json")
-            st.info("1. Copy the JSON above\n2. Open the Google Sheet\n3. Paste into cell A2\n4. Click 'Load from Sheet' to verify")
+            st.info("1. Copy the JSON above\n2. Open the Google Sheet\n3. Paste into cell A2\n4. Click 'Force Refresh from Sheet' to verify")
     
     st.divider()
     
-    data_json = json.dumps(st.session_state.habits, indent=2)
-    st.download_button(
-        label="💾 Download Backup",
-        data=data_json,
-        file_name="habit_tracker_backup.json",
-        mime="application/json",
-        use_container_width=True
-    )
+    # Only serialize the backup when the user asks for it (callable
+    # download data would need Streamlit 1.52+)
+    if st.checkbox("Prepare backup download", key="prepare_download"):
+        data_json = to_json(st.session_state.habits, indent=True)
+        st.download_button(
+            label="💾 Download Backup",
+            data=data_json,
+            file_name="habit_tracker_backup.json",
+            mime="application/json",
+            use_container_width=True
+        )
     
     uploaded_file = st.file_uploader("📁 Upload Backup", type=['json'])
     if uploaded_file is not None:
         try:
-            uploaded_data = json.load(uploaded_file)
-            st.session_state.habits = uploaded_data
-            save_data(st.session_state.habits)
+            uploaded_data = from_json(uploaded_file.read())
+            save_data(uploaded_data)
             st.success("Data restored successfully!")
             st.rerun()
         except:
             st.error("Invalid backup file!")
 
-# Tabs for different views
-tab1, tab2 = st.tabs(["📅 Calendar", "📊 Dashboard"])
-
-with tab1:
-    # Calculate monthly totals and streaks
-    monthly_totals = {}
-    today = date.today()
+# Calendar tab, isolated so its widgets only rerun this fragment
+@st.fragment
+def render_calendar():
+    ym_prefix = f"{st.session_state.current_year}-{st.session_state.current_month:02d}"
     
-    for habit_name, habit_data in st.session_state.habits.items():
-        if habit_name == 'notes':
-            continue
-        total = 0
-        for date_key, count in habit_data['count'].items():
-            if date_key.startswith(f"{st.session_state.current_year}-{st.session_state.current_month:02d}"):
-                total += count
-        monthly_totals[habit_name] = total
+    # Calculate monthly totals and streaks
+    monthly_totals = compute_monthly_totals(st.session_state.current_year, st.session_state.current_month)
+    streaks = compute_streaks(date.today())
     
     # Display monthly stats at top
     st.subheader(f"📊 {calendar.month_name[st.session_state.current_month]} {st.session_state.current_year} Summary")
-    cols = st.columns(len(monthly_totals))
-    for idx, (habit_name, total) in enumerate(monthly_totals.items()):
-        habit_data = st.session_state.habits[habit_name]
-        streak = calculate_streak(habit_data, today)
-        with cols[idx]:
-            st.markdown(f"""
-            <div class="stat-card" style="border-color: {habit_data['color']};">
-                <div style="font-size: 28px; margin-bottom: 5px;">{total}</div>
-                <div style="font-size: 16px; margin-bottom: 8px;">{habit_name}</div>
-                <div style="font-size: 14px; color: #888;">🔥 {streak} day streak</div>
-            </div>
-            """, unsafe_allow_html=True)
+    stat_cards = "".join(
+        _STAT_TMPL.format(
+            color=st.session_state.habits[habit_name]['color'],
+            total=total,
+            name=habit_name,
+            streak=streaks[habit_name]
+        )
+        for habit_name, total in monthly_totals.items()
+    )
+    st.markdown(f'<div class="stat-row">{stat_cards}</div>', unsafe_allow_html=True)
     
     st.divider()
     
@@ -405,48 +685,45 @@ with tab1:
     st.subheader(f"📅 {calendar.month_name[st.session_state.current_month]} {st.session_state.current_year}")
     
     # Get calendar data
-    cal = calendar.monthcalendar(st.session_state.current_year, st.session_state.current_month)
+    cal = _monthcalendar(st.session_state.current_year, st.session_state.current_month)
     
-    # Day headers
+    # Day headers and calendar grid, rendered as a single HTML block
     day_names = ['Mon', 'Tue', 'Wed', 'Thu', 'Fri', 'Sat', 'Sun']
-    header_cols = st.columns(7)
-    for idx, day_name in enumerate(day_names):
-        with header_cols[idx]:
-            st.markdown(f'<div class="header-day">{day_name}</div>', unsafe_allow_html=True)
+    dot_html = {
+        habit_name: f'<span class="dot" style="background: {st.session_state.habits[habit_name]["color"]};"></span>'
+        for habit_name in habit_names
+    }
+    html = ['<div class="cal-grid">']
+    for day_name in day_names:
+        html.append(f'<div class="header-day">{day_name}</div>')
     
-    # Calendar grid
     for week in cal:
-        cols = st.columns(7)
-        for idx, day in enumerate(week):
-            with cols[idx]:
-                if day == 0:
-                    st.markdown('<div class="day-cell empty-cell"></div>', unsafe_allow_html=True)
-                else:
-                    date_key = f"{st.session_state.current_year}-{st.session_state.current_month:02d}-{day:02d}"
-                    
-                    # Collect all dots for this day
-                    dots_html = ""
-                    for habit_name, habit_data in st.session_state.habits.items():
-                        if habit_name == 'notes':
-                            continue
-                        if date_key in habit_data['count']:
-                            count = habit_data['count'][date_key]
-                            for _ in range(count):
-                                dots_html += f'<span class="dot" style="background: {habit_data["color"]};"></span>'
-                    
-                    st.markdown(f"""
-                    <div class="day-cell">
-                        <div class="day-number">{day}</div>
-                        <div class="dots-container">{dots_html}</div>
-                    </div>
-                    """, unsafe_allow_html=True)
+        for day in week:
+            if day == 0:
+                html.append('<div class="day-cell empty-cell"></div>')
+            else:
+                date_key = f"{ym_prefix}-{day:02d}"
+                
+                # Collect all dots for this day
+                dots_html = "".join(
+                    dot * st.session_state.habits[habit_name]['count'].get(date_key, 0)
+                    for habit_name, dot in dot_html.items()
+                )
+                
+                html.append(
+                    f'<div class="day-cell"><div class="day-number">{day}</div>'
+                    f'<div class="dots-container">{dots_html}</div></div>'
+                )
+    
+    html.append('</div>')
+    st.markdown("".join(html), unsafe_allow_html=True)
     
     st.divider()
     
     # Monthly Notes Section
     st.subheader(f"📝 Notes for {calendar.month_name[st.session_state.current_month]} {st.session_state.current_year}")
     
-    note_key = f"{st.session_state.current_year}-{st.session_state.current_month:02d}"
+    note_key = ym_prefix
     current_note = st.session_state.habits['notes'].get(note_key, "")
     
     note_text = st.text_area(
@@ -466,7 +743,9 @@ with tab1:
             st.success("Note saved!")
             st.rerun()
 
-with tab2:
+# Dashboard tab, isolated so its widgets only rerun this fragment
+@st.fragment
+def render_dashboard():
     st.subheader("📊 Visualization Dashboard")
     
     # Month selector for dashboard
@@ -479,52 +758,35 @@ with tab2:
     dash_month_num = list(calendar.month_name).index(dash_month)
     
     # Calculate data for the selected month
-    monthly_data = defaultdict(int)
-    for habit_name, habit_data in st.session_state.habits.items():
-        if habit_name == 'notes':
-            continue
-        total = 0
-        for date_key, count in habit_data['count'].items():
-            if date_key.startswith(f"{dash_year}-{dash_month_num:02d}"):
-                total += count
-        monthly_data[habit_name] = total
+    monthly_data = compute_monthly_totals(dash_year, dash_month_num)
     
     # Create heatmap data
     st.subheader("🔥 Monthly Heatmap")
     
-    for habit_name, habit_data in st.session_state.habits.items():
-        if habit_name == 'notes':
-            continue
-        st.markdown(f"<div style='color: white; margin-bottom: 10px; font-weight: bold;'>{habit_name}</div>", unsafe_allow_html=True)
-        
-        max_count = max([habit_data['count'].get(f"{dash_year}-{dash_month_num:02d}-{day:02d}", 0) 
-                        for day in range(1, 32)], default=1)
+    days_in_month = _monthrange(dash_year, dash_month_num)[1]
+    dash_ym = f"{dash_year}-{dash_month_num:02d}"
+    
+    # Build every habit's heatmap into a single HTML block
+    html = []
+    for habit_name in habit_names:
+        habit_data = st.session_state.habits[habit_name]
+        html.append(f"<div style='color: white; margin-bottom: 10px; font-weight: bold;'>{habit_name}</div>")
         
-        # Create columns for heatmap
-        days_in_month = calendar.monthrange(dash_year, dash_month_num)[1]
+        month_counts = st.session_state.habits_by_month[habit_name].get(dash_ym, {})
+        counts = [month_counts.get(day, 0) for day in range(1, days_in_month + 1)]
+        max_count = max(counts, default=0)
+        color = habit_data['color']
         
         # Display in rows of 7
-        for week_start in range(0, days_in_month, 7):
-            cols = st.columns(7)
-            for i in range(7):
-                day = week_start + i + 1
-                if day <= days_in_month:
-                    with cols[i]:
-                        date_key = f"{dash_year}-{dash_month_num:02d}-{day:02d}"
-                        count = habit_data['count'].get(date_key, 0)
-                        opacity = min(count / max_count, 1) if max_count > 0 else 0.1
-                        
-                        color = habit_data['color']
-                        st.markdown(f"""
-                            <div style='width: 100%; height: 40px; background: {color}; 
-                                 opacity: {opacity}; border-radius: 3px; display: flex; 
-                                 align-items: center; justify-content: center; color: white; 
-                                 font-size: 12px; border: 1px solid #333; font-weight: bold;'>
-                                {day}
-                            </div>
-                        """, unsafe_allow_html=True)
-        
-        st.markdown("<br>", unsafe_allow_html=True)
+        html.append('<div class="cal-grid">')
+        for day, count in enumerate(counts, start=1):
+            # Quantize intensity into the .h0-.h5 opacity classes; h0 is
+            # reserved for days without activity
+            bucket = 0 if count == 0 else max(1, min(5, count * 5 // max_count))
+            html.append(f'<div class="heat-cell h{bucket}" style="background: {color};">{day}</div>')
+        html.append('</div><br>')
+    
+    st.markdown("".join(html), unsafe_allow_html=True)
     
     st.divider()
     
@@ -538,31 +800,41 @@ with tab2:
             # Create a simple visual representation
             total = sum(monthly_data.values())
             
-            for habit_name, count in monthly_data.items():
-                percentage = (count / total * 100) if total > 0 else 0
-                color = st.session_state.habits[habit_name]['color']
-                
-                st.markdown(f"""
-                <div style='display: flex; align-items: center; gap: 10px; margin-bottom: 10px;'>
-                    <div style='min-width: 150px; color: white;'>{habit_name}</div>
-                    <div style='flex-grow: 1; height: 30px; background: {color}; 
-                         border-radius: 5px; display: flex; align-items: center; 
-                         justify-content: center; color: white; font-weight: bold;'>
-                        {count} ({percentage:.1f}%)
-                    </div>
-                </div>
-                """, unsafe_allow_html=True)
+            st.markdown("".join(
+                _DIST_TMPL.format(
+                    name=habit_name,
+                    color=st.session_state.habits[habit_name]['color'],
+                    count=count,
+                    percentage=(count / total * 100) if total > 0 else 0
+                )
+                for habit_name, count in monthly_data.items()
+            ), unsafe_allow_html=True)
         
         with pie_cols[1]:
             st.markdown("### Totals")
-            for habit_name, count in monthly_data.items():
-                color = st.session_state.habits[habit_name]['color']
-                st.markdown(f"""
-                <div style='padding: 10px; margin: 5px 0; background: #1a1a1a; 
-                     border-left: 12px solid {color}; border-radius: 5px;'>
-                    <div style='color: white; font-weight: bold;'>{habit_name}</div>
-                    <div style='color: {color}; font-size: 24px;'>{count}</div>
-                </div>
-                """, unsafe_allow_html=True)
+            st.markdown("".join(
+                _TOTAL_TMPL.format(
+                    name=habit_name,
+                    color=st.session_state.habits[habit_name]['color'],
+                    count=count
+                )
+                for habit_name, count in monthly_data.items()
+            ), unsafe_allow_html=True)
     else:
-        st.info("No data for this month yet!")
\ No newline at end of file
+        st.info("No data for this month yet!")
+
+# Tabs for different views
+tab1, tab2 = st.tabs(["📅 Calendar", "📊 Dashboard"])
+
+with tab1:
+    render_calendar()
+
+with tab2:
+    render_dashboard()
+
+# Flush edits from this run straight away; edits made within the debounce
+# window of the last write are left to the flusher, so a burst of edits
+# becomes a single API call
+flush_sheet()
+if _sheets_client() is not None:
+    sheet_flusher()
@@ -2,35 +2,182 @@
 Credit Card Statement Parser
 Supports: ICICI Bank, Axis Bank, IDFC FIRST Bank, RBL Bank, American Express
 
-Requirements:
-pip install PyPDF2 pdfplumber pandas tabulate
+Requirements (Python 3.10+):
+pip install pdfplumber pandas tabulate
+(optional: pip install pymupdf, then pass --backend pymupdf)
 
 Usage:
 python parser.py statement1.pdf statement2.pdf
 python parser.py --dir ./statements/
 python parser.py statement.pdf --json output.json
+python parser.py --dir ./statements/ --backend pymupdf
 """
 
+import io
+import os
+import hashlib
 import re
 import sys
+import shutil
+import string
 import json
 import argparse
 from pathlib import Path
-from typing import Dict, List, Optional
-from dataclasses import dataclass, asdict
+from typing import TYPE_CHECKING, Dict, Iterator, List, Optional, Tuple
+from dataclasses import dataclass, asdict, fields
 from datetime import datetime
+from contextlib import closing, nullcontext
+from functools import lru_cache
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 
+# Optional: PyMuPDF extracts plain text far faster than pdfplumber, but the
+# field patterns are tuned against pdfplumber's layout, so it is opt-in
 try:
-    import pdfplumber
+    import fitz
+except ImportError:
+    fitz = None
+
+# Optional: pyahocorasick matches all literal issuer identifiers in one pass
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
+# Optional: RE2 matches in linear time with no backtracking blow-up
+try:
+    import re2
+except ImportError:
+    re2 = None
+
+# Optional: orjson serializes results much faster than stdlib json
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# pandas and tabulate are only imported when a table is requested
+if TYPE_CHECKING:
     import pandas as pd
-    from tabulate import tabulate
+
+try:
+    import pdfplumber
 except ImportError:
     print("Missing dependencies. Install with:")
-    print("pip install pdfplumber pandas tabulate")
+    print("pip install pdfplumber")
     sys.exit(1)
 
 
-@dataclass
+# Shared subpatterns for currency amounts: an optional currency prefix
+# and the captured amount itself. Rupee signs reach the patterns as a
+# backtick (see _NORMALIZE)
+_CUR = r"[`Rs\.?\s]*"
+_AMT = r"([0-9,]+\.?\d{0,2})"
+
+
+def _as_literal(pattern: str) -> Optional[str]:
+    """Return the lowercase text a pattern matches, or None if it needs regex"""
+    if re.search(r'\\\w|[.^$*+?{}\[\]|()]', re.sub(r'\\\W', '', pattern)):
+        return None
+    return re.sub(r'\\(\W)', r'\1', pattern).lower()
+
+
+def _compile(pattern: str, multiline: bool = False):
+    """Compile a pattern with RE2 when available, falling back to re for
+    patterns RE2 rejects or when it is not installed.
+
+    RE2's \\d and \\w are ASCII-only, unlike re's, so results can differ on
+    non-ASCII digits and letters; whitespace is folded by _lower_text.
+    """
+    if multiline:
+        pattern = "(?m)" + pattern
+    if re2 is not None:
+        try:
+            return re2.compile(pattern)
+        except re2.error:
+            pass
+    return re.compile(pattern)
+
+
+def _compile_config(config: Dict) -> Dict:
+    """Compile an issuer's identifier patterns once.
+
+    Patterns are lowercased and compiled without re.IGNORECASE; they are
+    matched against lowercased text (see _lower_text). Identifiers that
+    are plain text are kept as 'literals' and checked with substring search.
+    Field patterns are compiled on demand by CreditCardParser.field_patterns.
+    """
+    literals = [_as_literal(p) for p in config['identifier']]
+    return {
+        'literals': [lit for lit in literals if lit is not None],
+        'identifier': [
+            _compile(p.lower())
+            for p, lit in zip(config['identifier'], literals) if lit is None
+        ]
+    }
+
+
+def _build_automaton(compiled: Dict):
+    """Aho-Corasick automaton mapping each literal identifier to its issuer"""
+    if ahocorasick is None:
+        return None
+    automaton = ahocorasick.Automaton()
+    for issuer, config in compiled.items():
+        for literal in config['literals']:
+            automaton.add_word(literal, issuer)
+    automaton.make_automaton()
+    return automaton
+
+
+_ASCII_LOWER = str.maketrans(string.ascii_uppercase, string.ascii_lowercase)
+
+# Exotic whitespace (no-break and typographic spaces, Unicode line
+# separators) becomes a plain space, so \s means the same under re and
+# RE2, and rupee glyphs become the backtick some PDF fonts extract ₹ as.
+# Every mapping is one character to one, keeping offsets intact
+_NORMALIZE = (
+    *((c, " ") for c in "\x0b\x1c\x1d\x1e\x1f\x85\xa0\u1680\u2028\u2029\u202f\u205f\u3000"),
+    *((chr(c), " ") for c in range(0x2000, 0x200b)),
+    ("₹", "`"),
+    ("₨", "`"),
+)
+
+
+def _lower_text(text: str) -> str:
+    """Lowercase and normalize text while keeping every character at the same offset"""
+    lowered = text.lower()
+    if len(lowered) != len(text):
+        # Some characters lowercase to several; only fold ASCII instead
+        lowered = text.translate(_ASCII_LOWER)
+    # A substring scan per glyph beats str.translate, which drops to a
+    # per-character dict lookup as soon as the text is not pure ASCII
+    for glyph, replacement in _NORMALIZE:
+        if glyph in lowered:
+            lowered = lowered.replace(glyph, replacement)
+    return lowered
+
+
+def _dump_json(data) -> bytes:
+    """Serialize data as indented JSON bytes"""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    return json.dumps(data, indent=2).encode()
+
+
+def _import_table_deps():
+    """Import pandas and tabulate on first use, exiting with an install hint
+    when they are missing"""
+    try:
+        import pandas as pd
+        from tabulate import tabulate
+    except ImportError:
+        print("Missing dependencies. Install with:")
+        print("pip install pandas tabulate")
+        sys.exit(1)
+    return pd, tabulate
+
+
+@dataclass(slots=True)
 class StatementData:
     """Data structure for parsed statement information"""
     file_name: str
@@ -76,22 +223,22 @@ class CreditCardParser:
                     r'Payment\s+Due\s+Date[:\s]*(\w+\s+\d{1,2},\s+\d{4})'
                 ],
                 'total_amount_due': [
-                    r'Total\s+Amount\s+due[:\s]*[₹`Rs\.?\s]*([0-9,]+\.?\d{0,2})',
-                    r'Total\s+Payment\s+Due[:\s]*[₹`Rs\.?\s]*([0-9,]+\.?\d{0,2})'
+                    rf'Total\s+Amount\s+due[:\s]*{_CUR}{_AMT}',
+                    rf'Total\s+Payment\s+Due[:\s]*{_CUR}{_AMT}'
                 ],
                 'minimum_amount_due': [
-                    r'Minimum\s+Amount\s+due[:\s]*[₹`Rs\.?\s]*([0-9,]+\.?\d{0,2})',
-                    r'Minimum\s+Payment\s+Due[:\s]*[₹`Rs\.?\s]*([0-9,]+\.?\d{0,2})'
+                    rf'Minimum\s+Amount\s+due[:\s]*{_CUR}{_AMT}',
+                    rf'Minimum\s+Payment\s+Due[:\s]*{_CUR}{_AMT}'
                 ],
                 'credit_limit': [
-                    r'Credit\s+Limit\s*\(Including\s+cash\)[:\s]*[₹`Rs\.?\s]*([0-9,]+\.?\d{0,2})',
-                    r'Credit\s+Limit[:\s]*[₹`Rs\.?\s]*([0-9,]+\.?\d{0,2})'
+                    rf'Credit\s+Limit\s*\(Including\s+cash\)[:\s]*{_CUR}{_AMT}',
+                    rf'Credit\s+Limit[:\s]*{_CUR}{_AMT}'
                 ],
                 'available_credit': [
-                    r'Available\s+Credit\s*\(Including\s+cash\)[:\s]*[₹`Rs\.?\s]*([0-9,]+\.?\d{0,2})'
+                    rf'Available\s+Credit\s*\(Including\s+cash\)[:\s]*{_CUR}{_AMT}'
                 ],
                 'previous_balance': [
-                    r'Previous\s+Balance[:\s]*[₹`Rs\.?\s]*([0-9,]+\.?\d{0,2})'
+                    rf'Previous\s+Balance[:\s]*{_CUR}{_AMT}'
                 ]
             }
         },
@@ -115,21 +262,21 @@ class CreditCardParser:
                     r'Payment\s+Due\s+Date[:\s]*(\d{2}[\/\-]\d{2}[\/\-]\d{4})'
                 ],
                 'total_amount_due': [
-                    r'Total\s+Payment\s+Due[:\s]*([0-9,]+\.?\d{0,2})\s*Dr',
-                    r'Total\s+Amount\s+Due[:\s]*([0-9,]+\.?\d{0,2})'
+                    rf'Total\s+Payment\s+Due[:\s]*{_AMT}\s*Dr',
+                    rf'Total\s+Amount\s+Due[:\s]*{_AMT}'
                 ],
                 'minimum_amount_due': [
-                    r'Minimum\s+Payment\s+Due[:\s]*([0-9,]+\.?\d{0,2})\s*Dr',
-                    r'Minimum\s+Amount\s+Due[:\s]*([0-9,]+\.?\d{0,2})'
+                    rf'Minimum\s+Payment\s+Due[:\s]*{_AMT}\s*Dr',
+                    rf'Minimum\s+Amount\s+Due[:\s]*{_AMT}'
                 ],
                 'credit_limit': [
-                    r'Credit\s+Limit[:\s]*([0-9,]+\.?\d{0,2})'
+                    rf'Credit\s+Limit[:\s]*{_AMT}'
                 ],
                 'available_credit': [
-                    r'Available\s+Credit\s+Limit[:\s]*([0-9,]+\.?\d{0,2})'
+                    rf'Available\s+Credit\s+Limit[:\s]*{_AMT}'
                 ],
                 'previous_balance': [
-                    r'Previous\s+Balance[:\s]*-?\s*([0-9,]+\.?\d{0,2})\s*Dr'
+                    rf'Previous\s+Balance[:\s]*-?\s*{_AMT}\s*Dr'
                 ]
             }
         },
@@ -151,16 +298,16 @@ class CreditCardParser:
                     r'Payment\s+Due\s+Date[:\s]*(\d{2}\/\d{2}\/\d{4})'
                 ],
                 'total_amount_due': [
-                    r'Total\s+Amount\s+Due[:\s]*r([0-9,]+\.?\d{0,2})'
+                    rf'Total\s+Amount\s+Due[:\s]*r{_AMT}'
                 ],
                 'minimum_amount_due': [
-                    r'Minimum\s+Amount\s+Due[:\s]*r([0-9,]+\.?\d{0,2})'
+                    rf'Minimum\s+Amount\s+Due[:\s]*r{_AMT}'
                 ],
                 'credit_limit': [
-                    r'Credit\s+Limit[:\s]*r([0-9,]+\.?\d{0,2})'
+                    rf'Credit\s+Limit[:\s]*r{_AMT}'
                 ],
                 'available_credit': [
-                    r'Available\s+Credit\s+Limit[:\s]*r([0-9,]+\.?\d{0,2})'
+                    rf'Available\s+Credit\s+Limit[:\s]*r{_AMT}'
                 ]
             }
         },
@@ -182,13 +329,13 @@ class CreditCardParser:
                     r'Immediate(\d{2}\/\d{2}\/\d{4})'
                 ],
                 'total_amount_due': [
-                    r'([0-9,]+\.?\d{0,2})\s*\n\s*([0-9,]+\.?\d{0,2})\s*\n\s*0\.00'
+                    rf'{_AMT}\s*\n\s*{_AMT}\s*\n\s*0\.00'
                 ],
                 'minimum_amount_due': [
-                    r'Minimum[^0-9]*([0-9,]+\.?\d{0,2})'
+                    rf'Minimum[^0-9]*{_AMT}'
                 ],
                 'credit_limit': [
-                    r'([0-9,]+\.?\d{0,2})\s*0\.00\s*0\.00'
+                    rf'{_AMT}\s*0\.00\s*0\.00'
                 ]
             }
         },
@@ -210,68 +357,228 @@ class CreditCardParser:
                     r'Payment\s+Due\s+Date[:\s]*(\d{2}\/\d{2}\/\d{2,4})'
                 ],
                 'total_amount_due': [
-                    r'New\s+Balance[:\s]*\$([0-9,]+\.?\d{0,2})',
-                    r'Total[:\s]*\$([0-9,]+\.?\d{0,2})'
+                    rf'New\s+Balance[:\s]*\${_AMT}',
+                    rf'Total[:\s]*\${_AMT}'
                 ],
                 'minimum_amount_due': [
-                    r'Minimum\s+Payment\s+Due[:\s]*\$([0-9,]+\.?\d{0,2})'
+                    rf'Minimum\s+Payment\s+Due[:\s]*\${_AMT}'
                 ],
                 'credit_limit': [
-                    r'Pay\s+Over\s+Time\s+Limit[:\s]*\$([0-9,]+\.?\d{0,2})',
-                    r'Credit\s+Limit[:\s]*\$([0-9,]+\.?\d{0,2})'
+                    rf'Pay\s+Over\s+Time\s+Limit[:\s]*\${_AMT}',
+                    rf'Credit\s+Limit[:\s]*\${_AMT}'
                 ],
                 'available_credit': [
-                    r'Available\s+Pay\s+Over\s+Time\s+Limit[:\s]*\$([0-9,]+\.?\d{0,2})'
+                    rf'Available\s+Pay\s+Over\s+Time\s+Limit[:\s]*\${_AMT}'
                 ],
                 'previous_balance': [
-                    r'Previous\s+Balance[:\s]*\$([0-9,]+\.?\d{0,2})'
+                    rf'Previous\s+Balance[:\s]*\${_AMT}'
                 ]
             }
         }
     }
 
-    def __init__(self):
+    # Identifier patterns of every issuer, compiled once at import time
+    COMPILED = {issuer: _compile_config(config) for issuer, config in PARSERS.items()}
+    LITERAL_AUTOMATON = _build_automaton(COMPILED)
+
+    # Leading characters of a statement searched for issuer branding
+    # before falling back to the full text
+    HEADER_CHARS = 4096
+
+    # Fields without which a statement counts as failed
+    CRITICAL_FIELDS = ['card_number', 'total_amount_due', 'payment_due_date']
+
+    # Text extraction backends; pdfplumber is the one the patterns target
+    BACKENDS = ['pdfplumber', 'pymupdf']
+
+    # Parsed results can be cached per file content, in one directory per
+    # backend. Entries hold card and account numbers, so caching is opt-in
+    # and the directory is private to the user. The version covers the
+    # patterns and the regex engine; bump CACHE_SCHEMA whenever parsing
+    # logic changes results without touching PARSERS
+    DEFAULT_CACHE_DIR = Path.home() / ".cache" / "cc_parser"
+    CACHE_SCHEMA = 1
+    CACHE_VERSION = hashlib.blake2b(
+        repr((CACHE_SCHEMA, PARSERS, re2 is None)).encode(), digest_size=8
+    ).hexdigest()
+
+    def __init__(self, cache_dir: Optional[Path] = None,
+                 backend: str = 'pdfplumber'):
+        if backend not in self.BACKENDS:
+            raise ValueError(f"Unknown backend: {backend}")
+        if backend == 'pymupdf' and fitz is None:
+            raise ValueError("The pymupdf backend requires PyMuPDF (pip install pymupdf)")
         self.results = []
+        self.backend = backend
+        self.cache_dir = cache_dir
+        self._dataframe = None
 
-    def extract_text_from_pdf(self, pdf_path: Path) -> str:
-        """Extract text from PDF using pdfplumber"""
+    @classmethod
+    @lru_cache(maxsize=None)
+    def field_patterns(cls, issuer: str) -> Dict[str, List[re.Pattern]]:
+        """Compiled field patterns of an issuer, built on first use and shared
+        by every parser instance"""
+        return {
+            field: [_compile(p.lower(), multiline=True) for p in patterns]
+            for field, patterns in cls.PARSERS[issuer]['patterns'].items()
+        }
+
+    def iter_pages_from_pdf(self, pdf_path: Path) -> Iterator[str]:
+        """Lazily extract the text of each page of a PDF file"""
+        # Load the whole file up front; statements are small and parsers
+        # index a contiguous buffer much faster than a file stream
+        return self.iter_pages_from_bytes(pdf_path.read_bytes())
+
+    def iter_pages_from_bytes(self, data: bytes) -> Iterator[str]:
+        """Lazily extract the text of each page with the configured backend"""
         try:
-            text = ""
-            with pdfplumber.open(pdf_path) as pdf:
+            if self.backend == 'pymupdf':
+                with fitz.open(stream=data, filetype="pdf") as doc:
+                    for page in doc:
+                        yield page.get_text("text")
+                return
+            
+            with pdfplumber.open(io.BytesIO(data)) as pdf:
                 for page in pdf.pages:
-                    text += page.extract_text() or ""
-            return text
+                    yield page.extract_text() or ""
         except Exception as e:
             raise Exception(f"Failed to extract text from PDF: {str(e)}")
 
+    def extract_text_from_pdf(self, pdf_path: Path) -> str:
+        """Extract the full text of a PDF"""
+        return "\n".join(self.iter_pages_from_pdf(pdf_path))
+
     def identify_issuer(self, text: str) -> Optional[str]:
         """Identify the credit card issuer from statement text"""
-        for issuer, config in self.PARSERS.items():
+        # Branding sits in the letterhead, so try the header slice first
+        issuer = self._match_issuer(_lower_text(text[:self.HEADER_CHARS]))
+        if issuer is None and len(text) > self.HEADER_CHARS:
+            issuer = self._match_issuer(_lower_text(text))
+        return issuer
+
+    def _match_issuer(self, text_lower: str) -> Optional[str]:
+        """First issuer, in priority order, whose identifier is in the lowercased text"""
+        # Issuers with a literal identifier in the text, found in one pass
+        literal_hits = None
+        if self.LITERAL_AUTOMATON is not None:
+            literal_hits = {issuer for _, issuer in self.LITERAL_AUTOMATON.iter(text_lower)}
+        
+        # Issuers are still checked in their configured priority order
+        for issuer, config in self.COMPILED.items():
+            if literal_hits is not None:
+                if issuer in literal_hits:
+                    return issuer
+            elif any(lit in text_lower for lit in config['literals']):
+                return issuer
             for pattern in config['identifier']:
-                if re.search(pattern, text, re.IGNORECASE):
+                if pattern.search(text_lower):
                     return issuer
         return None
 
-    def extract_field(self, text: str, patterns: List[str]) -> Optional[str]:
-        """Try multiple patterns to extract a field"""
+    def extract_field(self, text: str, patterns: List[re.Pattern],
+                      text_lower: Optional[str] = None) -> Optional[str]:
+        """Try multiple compiled patterns to extract a field"""
+        if text_lower is None:
+            text_lower = _lower_text(text)
         for pattern in patterns:
-            match = re.search(pattern, text, re.IGNORECASE | re.MULTILINE)
+            match = pattern.search(text_lower)
             if match:
-                # Return the last group if multiple groups exist
-                groups = match.groups()
-                return groups[-1] if groups else match.group(0)
+                # Return the last group if multiple groups exist, sliced
+                # from the original text to keep its case
+                start, end = match.span(pattern.groups)
+                return text[start:end] if start >= 0 else None
         return None
 
+    def extract_fields(self, text: str, patterns: Dict[str, List[re.Pattern]],
+                       fields: Optional[List[str]] = None) -> Dict[str, Optional[str]]:
+        """Extract the given fields (default: all) of an issuer from the text"""
+        text_lower = _lower_text(text)
+        return {
+            field: self.extract_field(text, patterns[field], text_lower)
+            for field in (fields or patterns)
+        }
+
+    def _parse_pages(self, pages: Iterator[str]) -> Tuple[Optional[str], Dict[str, Optional[str]]]:
+        """Identify the issuer and extract fields, stopping once all are found"""
+        first_page = next(pages, "")
+        issuer = self.identify_issuer(first_page)
+        
+        if not issuer:
+            # Issuer branding is not on page 1; fall back to the full text
+            text = "\n".join([first_page, *pages])
+            issuer = self.identify_issuer(text)
+            if not issuer:
+                return None, {}
+            return issuer, self.extract_fields(text, self.field_patterns(issuer))
+        
+        patterns = self.field_patterns(issuer)
+        values = self.extract_fields(first_page, patterns)
+        for page in pages:
+            missing = [field for field, value in values.items() if value is None]
+            if not missing:
+                break
+            values.update(self.extract_fields(page, patterns, missing))
+        return issuer, values
+
+    def _cache_path(self, data: bytes) -> Optional[Path]:
+        """Location of the cached result for these file contents"""
+        if self.cache_dir is None:
+            return None
+        digest = hashlib.blake2b(data, digest_size=16, person=self.CACHE_VERSION.encode()).hexdigest()
+        return self.cache_dir / self.backend / f"{digest}.json"
+
+    @classmethod
+    def clear_cache(cls, cache_dir: Path = DEFAULT_CACHE_DIR):
+        """Delete every cached result"""
+        shutil.rmtree(cache_dir, ignore_errors=True)
+
     def parse_statement(self, pdf_path: Path) -> StatementData:
-        """Parse a single credit card statement"""
-        file_name = pdf_path.name
+        """Parse a single credit card statement, reusing a cached result if present"""
+        try:
+            data = pdf_path.read_bytes()
+        except OSError as e:
+            return StatementData(
+                file_name=pdf_path.name,
+                issuer="Error",
+                parsing_status="error",
+                errors=[f"Failed to extract text from PDF: {str(e)}"]
+            )
+        
+        cache_path = self._cache_path(data)
+        if cache_path is not None and cache_path.exists():
+            try:
+                cached = json.loads(cache_path.read_text())
+                cached['file_name'] = pdf_path.name
+                return StatementData(**cached)
+            except Exception:
+                pass  # Unreadable cache entry; parse again
+        
+        result = self._parse_bytes(pdf_path.name, data)
+        
+        if cache_path is not None and result.parsing_status != "error":
+            try:
+                # Owner-only directories and files; entries hold card data
+                self.cache_dir.parent.mkdir(parents=True, exist_ok=True)
+                for directory in (self.cache_dir, cache_path.parent):
+                    directory.mkdir(mode=0o700, exist_ok=True)
+                    os.chmod(directory, 0o700)
+                tmp_path = cache_path.with_suffix(f".{os.getpid()}.tmp")
+                fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+                with os.fdopen(fd, "w") as f:
+                    f.write(json.dumps(asdict(result)))
+                os.replace(tmp_path, cache_path)
+            except OSError:
+                pass  # Caching is best effort
         
+        return result
+
+    def _parse_bytes(self, file_name: str, data: bytes) -> StatementData:
+        """Parse the contents of a single credit card statement"""
         try:
-            # Extract text
-            text = self.extract_text_from_pdf(pdf_path)
-            
-            # Identify issuer
-            issuer = self.identify_issuer(text)
+            # Pages are extracted lazily; statement metadata is nearly always
+            # on page 1, so later pages are only decoded while fields are missing
+            with closing(self.iter_pages_from_bytes(data)) as pages:
+                issuer, values = self._parse_pages(pages)
             
             if not issuer:
                 return StatementData(
@@ -281,15 +588,11 @@ class CreditCardParser:
                     errors=["Could not identify credit card issuer"]
                 )
             
-            # Get parser configuration
-            config = self.PARSERS[issuer]
-            
-            # Extract all fields
+            # Collect extracted fields
             data = StatementData(file_name=file_name, issuer=issuer)
             errors = []
             
-            for field, patterns in config['patterns'].items():
-                value = self.extract_field(text, patterns)
+            for field, value in values.items():
                 if value:
                     setattr(data, field, value.strip())
                 else:
@@ -299,8 +602,7 @@ class CreditCardParser:
             if errors:
                 data.errors = errors
                 # Only mark as failed if no critical fields were extracted
-                critical_fields = ['card_number', 'total_amount_due', 'payment_due_date']
-                if all(getattr(data, f) is None for f in critical_fields):
+                if all(getattr(data, f) is None for f in self.CRITICAL_FIELDS):
                     data.parsing_status = "failed"
                 else:
                     data.parsing_status = "partial"
@@ -316,38 +618,72 @@ class CreditCardParser:
             )
 
     def parse_multiple(self, pdf_paths: List[Path]) -> List[StatementData]:
-        """Parse multiple PDF statements"""
+        """Parse multiple PDF statements, one worker process per core"""
         self.results = []
+        self._dataframe = None
+        workers = min(os.cpu_count() or 1, 8, len(pdf_paths))
+        
+        executor = ProcessPoolExecutor(max_workers=workers) if workers > 1 else None
         
-        for pdf_path in pdf_paths:
-            print(f"Processing: {pdf_path.name}...")
-            result = self.parse_statement(pdf_path)
-            self.results.append(result)
+        with executor or nullcontext():
+            parsed = executor.map(self.parse_statement, pdf_paths) if executor else map(self.parse_statement, pdf_paths)
             
-            # Print immediate feedback
-            status_symbol = "✓" if result.parsing_status == "success" else "⚠" if result.parsing_status == "partial" else "✗"
-            print(f"  {status_symbol} {result.issuer} - {result.parsing_status}")
+            # Results arrive in input order
+            try:
+                for pdf_path, result in zip(pdf_paths, parsed):
+                    self._add_result(pdf_path, result)
+            except BrokenProcessPool:
+                # A worker died (e.g. crashed on a malformed PDF). Give each
+                # pending file its own worker so only the culprit is lost
+                print("Warning: worker process died; parsing remaining files one per process", flush=True)
+                for pdf_path in pdf_paths[len(self.results):]:
+                    self._add_result(pdf_path, self._parse_isolated(pdf_path))
         
         return self.results
 
+    def _parse_isolated(self, pdf_path: Path) -> StatementData:
+        """Parse a statement in a short-lived worker process, recording an
+        error if the worker dies"""
+        with ProcessPoolExecutor(max_workers=1) as executor:
+            try:
+                return executor.submit(self.parse_statement, pdf_path).result()
+            except BrokenProcessPool:
+                return StatementData(
+                    file_name=pdf_path.name,
+                    issuer="Error",
+                    parsing_status="error",
+                    errors=["Worker process died while parsing the PDF"]
+                )
+
+    def _add_result(self, pdf_path: Path, result: StatementData):
+        """Record a parsed statement and print immediate feedback"""
+        self.results.append(result)
+        status_symbol = "✓" if result.parsing_status == "success" else "⚠" if result.parsing_status == "partial" else "✗"
+        print(f"  {status_symbol} {pdf_path.name}: {result.issuer} - {result.parsing_status}", flush=True)
+
     def to_dict(self) -> List[Dict]:
         """Convert results to dictionary format"""
         return [asdict(r) for r in self.results]
 
-    def to_dataframe(self) -> pd.DataFrame:
-        """Convert results to pandas DataFrame"""
-        return pd.DataFrame([asdict(r) for r in self.results])
+    def to_dataframe(self) -> "pd.DataFrame":
+        """Convert results to pandas DataFrame, built column by column"""
+        if self._dataframe is None:
+            pd, _ = _import_table_deps()
+            self._dataframe = pd.DataFrame({
+                f.name: [getattr(r, f.name) for r in self.results]
+                for f in fields(StatementData)
+            })
+        return self._dataframe
 
     def to_json(self, output_path: Optional[Path] = None) -> str:
         """Export results as JSON"""
-        data = self.to_dict()
-        json_str = json.dumps(data, indent=2)
+        json_bytes = _dump_json(self.to_dict())
         
         if output_path:
-            output_path.write_text(json_str)
+            output_path.write_bytes(json_bytes)
             print(f"\nJSON exported to: {output_path}")
         
-        return json_str
+        return json_bytes.decode()
 
     def print_summary(self):
         """Print a formatted summary of results"""
@@ -388,6 +724,7 @@ class CreditCardParser:
             print("No results to display")
             return
         
+        _, tabulate = _import_table_deps()
         df = self.to_dataframe()
         
         # Select key columns for display
@@ -417,6 +754,7 @@ Examples:
   python parser.py --dir ./statements/
   python parser.py *.pdf --json output.json
   python parser.py statement.pdf --format table
+  python parser.py --dir ./statements/ --backend pymupdf
         """
     )
     
@@ -425,9 +763,21 @@ Examples:
     parser.add_argument('--json', '-j', help='Export results to JSON file')
     parser.add_argument('--format', '-f', choices=['summary', 'table', 'both'], 
                        default='both', help='Output format (default: both)')
+    parser.add_argument('--cache', action='store_true',
+                       help=f'Cache parsed results (including card numbers) in {CreditCardParser.DEFAULT_CACHE_DIR}')
+    parser.add_argument('--clear-cache', action='store_true',
+                       help='Delete all cached results')
+    parser.add_argument('--backend', choices=CreditCardParser.BACKENDS, default='pdfplumber',
+                       help='PDF text extraction backend (default: pdfplumber)')
     
     args = parser.parse_args()
     
+    if args.clear_cache:
+        CreditCardParser.clear_cache()
+        print(f"Cleared cached results in {CreditCardParser.DEFAULT_CACHE_DIR}")
+        if not args.files and not args.dir:
+            return
+    
     # Collect PDF files
     pdf_files = []
     
@@ -451,8 +801,20 @@ Examples:
         print("No PDF files found. Use --help for usage information.")
         sys.exit(1)
     
+    if args.backend == 'pymupdf' and fitz is None:
+        print("Missing dependencies. Install with:")
+        print("pip install pymupdf")
+        sys.exit(1)
+    
+    # Fail before parsing if the table output cannot be printed
+    if args.format in ['table', 'both']:
+        _import_table_deps()
+    
     # Initialize parser
-    cc_parser = CreditCardParser()
+    cc_parser = CreditCardParser(
+        cache_dir=CreditCardParser.DEFAULT_CACHE_DIR if args.cache else None,
+        backend=args.backend
+    )
     
     # Parse statements
     print(f"\nParsing {len(pdf_files)} statement(s)...\n")